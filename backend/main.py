@@ -10,37 +10,81 @@ Features:
 - Proper error handling
 
 Run: uvicorn main:app --reload --port 8000
+Production: python main.py (uvloop + httptools, one worker per core; DEBUG=1 for reload)
 """
 
 import os
+import time
+import queue
+import logging
+import logging.handlers
 import asyncio
 import tempfile
+import itertools
+from contextlib import asynccontextmanager
 from datetime import datetime
 from typing import Optional, List
 from pathlib import Path
 
+import aiofiles
 from fastapi import FastAPI, HTTPException, UploadFile, File, Form
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from pydantic import BaseModel
 from dotenv import load_dotenv
 
-from twitter_service import TwitterService, get_twitter_service
+from twitter_service import (
+    TwitterService, get_twitter_service, close_twitter_service, CONTENT_TYPE_EXTENSIONS
+)
+from post_store import get_post_store
 
 # Load environment variables
 load_dotenv()
 
+DEBUG = os.getenv("DEBUG", "").lower() in ("1", "true", "yes")
+
+# Log through a queue so request handlers never block on stdout
+_log_queue: queue.SimpleQueue = queue.SimpleQueue()
+_log_handler = logging.StreamHandler()
+_log_handler.setFormatter(logging.Formatter("[%(levelname)s] %(name)s: %(message)s"))
+_log_listener = logging.handlers.QueueListener(_log_queue, _log_handler)
+
+_twitter_log = logging.getLogger("twitter_service")
+_twitter_log.setLevel(logging.INFO)
+_twitter_log.addHandler(logging.handlers.QueueHandler(_log_queue))
+_twitter_log.propagate = False
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    _log_listener.start()
+    yield
+    # Release pooled connections on shutdown
+    await close_twitter_service()
+    _log_listener.stop()
+
+
 # Initialize FastAPI
 app = FastAPI(
     title="Social Media Dashboard API",
     description="Twitter-focused social media posting API",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse
 )
 
-# CORS for frontend
+# CORS for frontend. Explicit origins let credentials through; the wildcard
+# is only used in DEBUG and, per the CORS spec, without credentials.
+CORS_ORIGINS = [
+    origin.strip()
+    for origin in os.getenv("CORS_ORIGINS", "http://localhost:5173,http://localhost:3000").split(",")
+    if origin.strip()
+]
+
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:5173", "http://localhost:3000", "*"],
-    allow_credentials=True,
+    allow_origins=["*"] if DEBUG else CORS_ORIGINS,
+    allow_credentials=not DEBUG,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -49,9 +93,29 @@ app.add_middleware(
 UPLOAD_DIR = Path(tempfile.gettempdir()) / "smm_uploads"
 UPLOAD_DIR.mkdir(exist_ok=True)
 
-# In-memory post storage (replace with database in production)
-POSTS_DB: List[dict] = []
-POST_ID_COUNTER = 1
+# Upload size limits and streaming chunk size
+MAX_IMAGE_UPLOAD = 5 * 1024 * 1024       # 5MB
+MAX_VIDEO_UPLOAD = 512 * 1024 * 1024     # 512MB
+UPLOAD_CHUNK_SIZE = 1024 * 1024          # 1MB
+
+# Concurrent workers for batch publishing
+PUBLISH_BATCH_WORKERS = 4
+
+# Per-process sequence for unique upload filenames within the same second
+_UPLOAD_SEQ = itertools.count()
+
+
+def now_iso() -> str:
+    """Current UTC time as an ISO string. Call once per request and reuse."""
+    return datetime.utcnow().isoformat()
+
+
+def upload_stamp() -> str:
+    """
+    Unique, cheap filename stamp: epoch seconds, process id and a sequence number.
+    The pid keeps stamps unique across server worker processes.
+    """
+    return f"{int(time.time())}_{os.getpid()}_{next(_UPLOAD_SEQ)}"
 
 
 # ============== MODELS ==============
@@ -67,6 +131,10 @@ class PostPublish(BaseModel):
     post_id: int
 
 
+class PostBatchPublish(BaseModel):
+    post_ids: List[int]
+
+
 class TwitterCredentials(BaseModel):
     api_key: str
     api_secret: str
@@ -87,7 +155,7 @@ async def health_check():
     return {
         "status": "healthy",
         "twitter_configured": twitter.enabled,
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": now_iso()
     }
 
 
@@ -97,7 +165,7 @@ async def health_check():
 async def get_twitter_status():
     """Get Twitter connection status with account details."""
     twitter = get_twitter_service()
-    return twitter.get_status()
+    return await twitter.get_status()
 
 
 @app.post("/api/twitter/test")
@@ -111,7 +179,7 @@ async def test_twitter_connection():
             detail="Twitter not configured. Add credentials to .env file."
         )
 
-    status = twitter.get_status()
+    status = await twitter.get_status()
 
     if not status.get("connected"):
         raise HTTPException(
@@ -132,16 +200,14 @@ async def test_twitter_connection():
 @app.get("/api/posts")
 async def list_posts():
     """List all posts."""
-    return {"posts": POSTS_DB, "total": len(POSTS_DB)}
+    posts = await asyncio.to_thread(get_post_store().list_posts)
+    return {"posts": posts, "total": len(posts)}
 
 
 @app.post("/api/posts")
 async def create_post(post: PostCreate):
     """Create a new post (draft)."""
-    global POST_ID_COUNTER
-
-    new_post = {
-        "id": POST_ID_COUNTER,
+    new_post = await asyncio.to_thread(get_post_store().create_post, {
         "content": post.content,
         "image_url": post.image_url,
         "video_url": post.video_url,
@@ -150,15 +216,12 @@ async def create_post(post: PostCreate):
         "scheduled_time": post.scheduled_time,
         "word_count": len(post.content.split()),
         "char_count": len(post.content),
-        "created_at": datetime.utcnow().isoformat(),
+        "created_at": now_iso(),
         "posted_time": None,
         "tweet_id": None,
         "tweet_url": None,
         "error_message": None
-    }
-
-    POSTS_DB.insert(0, new_post)
-    POST_ID_COUNTER += 1
+    })
 
     return {"success": True, "post": new_post}
 
@@ -166,13 +229,46 @@ async def create_post(post: PostCreate):
 @app.delete("/api/posts/{post_id}")
 async def delete_post(post_id: int):
     """Delete a post."""
-    global POSTS_DB
-    POSTS_DB = [p for p in POSTS_DB if p["id"] != post_id]
+    await asyncio.to_thread(get_post_store().delete_post, post_id)
     return {"success": True}
 
 
 # ============== MEDIA UPLOAD ==============
 
+async def save_upload(file: UploadFile, file_path: Path, max_size: int, limit_label: str) -> int:
+    """
+    Stream an uploaded file to disk in chunks.
+    Writes to a .part file and renames it into place once complete,
+    so a crash never leaves a truncated upload at file_path.
+    Aborts with 413 as soon as the size limit is exceeded.
+
+    Returns:
+        Number of bytes written
+    """
+    part_path = file_path.with_name(file_path.name + ".part")
+    file_size = 0
+
+    try:
+        async with aiofiles.open(part_path, "wb", buffering=UPLOAD_CHUNK_SIZE) as f:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                file_size += len(chunk)
+                if file_size > max_size:
+                    raise HTTPException(
+                        status_code=413,
+                        detail=f"File too large. Max: {limit_label}"
+                    )
+                await f.write(chunk)
+
+        os.replace(part_path, file_path)
+
+    except BaseException:
+        if os.path.exists(part_path):
+            os.remove(part_path)
+        raise
+
+    return file_size
+
+
 @app.post("/api/upload")
 async def upload_media(file: UploadFile = File(...)):
     """
@@ -188,37 +284,18 @@ async def upload_media(file: UploadFile = File(...)):
             detail=f"Invalid file type: {content_type}. Use image or video files."
         )
 
-    # Read file content
-    content = await file.read()
-    file_size = len(content)
-
     # Check file size limits
     is_video = content_type.startswith("video/")
-    max_size = 512 * 1024 * 1024 if is_video else 5 * 1024 * 1024
-
-    if file_size > max_size:
-        raise HTTPException(
-            status_code=400,
-            detail=f"File too large. Max: {'512MB' if is_video else '5MB'}"
-        )
+    max_size = MAX_VIDEO_UPLOAD if is_video else MAX_IMAGE_UPLOAD
 
     # Determine extension
-    ext_map = {
-        "image/jpeg": ".jpg",
-        "image/png": ".png",
-        "image/gif": ".gif",
-        "image/webp": ".webp",
-        "video/mp4": ".mp4",
-        "video/quicktime": ".mov",
-    }
-    ext = ext_map.get(content_type, ".tmp")
+    ext = CONTENT_TYPE_EXTENSIONS.get(content_type, ".tmp")
 
     # Save file
-    filename = f"upload_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}_{file.filename or 'media'}{ext}"
+    filename = f"upload_{upload_stamp()}_{file.filename or 'media'}{ext}"
     file_path = UPLOAD_DIR / filename
 
-    with open(file_path, "wb") as f:
-        f.write(content)
+    file_size = await save_upload(file, file_path, max_size, "512MB" if is_video else "5MB")
 
     return {
         "success": True,
@@ -232,14 +309,14 @@ async def upload_media(file: UploadFile = File(...)):
 
 # ============== PUBLISH TO TWITTER ==============
 
-@app.post("/api/posts/{post_id}/publish")
-async def publish_post(post_id: int):
+async def publish_one(post_id: int) -> dict:
     """
-    Publish a post to Twitter.
-    Handles text, images, and videos with retry logic.
+    Publish a stored post to Twitter and update its status.
+    Raises HTTPException if the post cannot be published.
     """
     # Find the post
-    post = next((p for p in POSTS_DB if p["id"] == post_id), None)
+    store = get_post_store()
+    post = await asyncio.to_thread(store.get_post, post_id)
 
     if not post:
         raise HTTPException(status_code=404, detail="Post not found")
@@ -267,14 +344,29 @@ async def publish_post(post_id: int):
 
     # Update post status
     if result["success"]:
-        post["status"] = "posted"
-        post["posted_time"] = datetime.utcnow().isoformat()
-        post["tweet_id"] = result.get("post_id")
-        post["tweet_url"] = result.get("url")
-        post["error_message"] = None
+        post = await asyncio.to_thread(
+            store.update_status,
+            post_id,
+            status="posted",
+            posted_time=now_iso(),
+            tweet_id=result.get("post_id"),
+            tweet_url=result.get("url"),
+            error_message=None
+        )
     else:
-        post["status"] = "failed"
-        post["error_message"] = result.get("error")
+        post = await asyncio.to_thread(
+            store.update_status,
+            post_id,
+            status="failed",
+            error_message=result.get("error")
+        )
+
+    # The post was deleted while the tweet was in flight
+    if post is None:
+        detail = "Post was deleted while publishing"
+        if result["success"]:
+            detail += f"; tweet was still posted: {result.get('url')}"
+        raise HTTPException(status_code=409, detail=detail)
 
     return {
         "success": result["success"],
@@ -283,6 +375,58 @@ async def publish_post(post_id: int):
     }
 
 
+@app.post("/api/posts/{post_id}/publish")
+async def publish_post(post_id: int):
+    """
+    Publish a post to Twitter.
+    Handles text, images, and videos with retry logic.
+    """
+    return await publish_one(post_id)
+
+
+@app.post("/api/posts/publish-batch")
+async def publish_batch(batch: PostBatchPublish):
+    """
+    Publish several posts to Twitter concurrently.
+    Posts are fanned out to a small pool of workers so bulk
+    publishing stays within Twitter's rate limits.
+    """
+    twitter = get_twitter_service()
+
+    if not twitter.enabled:
+        raise HTTPException(
+            status_code=400,
+            detail="Twitter not configured. Add API credentials to .env file."
+        )
+
+    pending: asyncio.Queue = asyncio.Queue()
+    for post_id in dict.fromkeys(batch.post_ids):
+        pending.put_nowait(post_id)
+
+    results = {}
+
+    async def worker():
+        while not pending.empty():
+            post_id = pending.get_nowait()
+            try:
+                results[post_id] = await publish_one(post_id)
+            except HTTPException as e:
+                results[post_id] = {"success": False, "post_id": post_id, "error": e.detail}
+            except Exception as e:
+                results[post_id] = {"success": False, "post_id": post_id, "error": str(e)}
+
+    workers = min(PUBLISH_BATCH_WORKERS, pending.qsize())
+    await asyncio.gather(*(worker() for _ in range(workers)))
+
+    ordered = [results[post_id] for post_id in dict.fromkeys(batch.post_ids)]
+    return {
+        "success": all(r["success"] for r in ordered),
+        "published": sum(1 for r in ordered if r["success"]),
+        "failed": sum(1 for r in ordered if not r["success"]),
+        "results": ordered
+    }
+
+
 @app.post("/api/publish-direct")
 async def publish_direct(
     content: str = Form(...),
@@ -309,21 +453,15 @@ async def publish_direct(
         if not (content_type.startswith("image/") or content_type.startswith("video/")):
             raise HTTPException(status_code=400, detail="Invalid file type")
 
-        file_content = await file.read()
+        is_video = content_type.startswith("video/")
+        max_size = MAX_VIDEO_UPLOAD if is_video else MAX_IMAGE_UPLOAD
 
-        ext_map = {
-            "image/jpeg": ".jpg",
-            "image/png": ".png",
-            "image/gif": ".gif",
-            "video/mp4": ".mp4",
-        }
-        ext = ext_map.get(content_type, ".tmp")
+        ext = CONTENT_TYPE_EXTENSIONS.get(content_type, ".tmp")
 
-        filename = f"direct_{datetime.utcnow().strftime('%Y%m%d_%H%M%S')}{ext}"
+        filename = f"direct_{upload_stamp()}{ext}"
         media_path = UPLOAD_DIR / filename
 
-        with open(media_path, "wb") as f:
-            f.write(file_content)
+        await save_upload(file, media_path, max_size, "512MB" if is_video else "5MB")
 
         media_path = str(media_path)
 
@@ -334,20 +472,17 @@ async def publish_direct(
     )
 
     # Create record
-    global POST_ID_COUNTER
-    new_post = {
-        "id": POST_ID_COUNTER,
+    now = now_iso()
+    new_post = await asyncio.to_thread(get_post_store().create_post, {
         "content": content,
         "platforms": ["twitter"],
         "status": "posted" if result["success"] else "failed",
-        "created_at": datetime.utcnow().isoformat(),
-        "posted_time": datetime.utcnow().isoformat() if result["success"] else None,
+        "created_at": now,
+        "posted_time": now if result["success"] else None,
         "tweet_id": result.get("post_id"),
         "tweet_url": result.get("url"),
         "error_message": result.get("error")
-    }
-    POSTS_DB.insert(0, new_post)
-    POST_ID_COUNTER += 1
+    })
 
     return {
         "success": result["success"],
@@ -363,16 +498,13 @@ async def get_stats():
     """Get dashboard statistics."""
     twitter = get_twitter_service()
 
-    total = len(POSTS_DB)
-    posted = len([p for p in POSTS_DB if p["status"] == "posted"])
-    failed = len([p for p in POSTS_DB if p["status"] == "failed"])
-    scheduled = len([p for p in POSTS_DB if p["status"] == "scheduled"])
+    counts = await asyncio.to_thread(get_post_store().status_counts)
 
     return {
-        "totalPosts": total,
-        "postedPosts": posted,
-        "failedPosts": failed,
-        "scheduledPosts": scheduled,
+        "totalPosts": sum(counts.values()),
+        "postedPosts": counts.get("posted", 0),
+        "failedPosts": counts.get("failed", 0),
+        "scheduledPosts": counts.get("scheduled", 0),
         "connectedPlatforms": 1 if twitter.enabled else 0,
         "twitter_connected": twitter.enabled
     }
@@ -384,7 +516,7 @@ async def get_stats():
 async def get_platform_status():
     """Get all platform connection status."""
     twitter = get_twitter_service()
-    twitter_status = twitter.get_status()
+    twitter_status = await twitter.get_status()
 
     return [
         {
@@ -415,4 +547,18 @@ if __name__ == "__main__":
     print("\nMake sure your .env file has Twitter credentials!")
     print("=" * 60 + "\n")
 
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    if DEBUG:
+        # Development: single process with auto-reload
+        uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
+    else:
+        # Production: uvloop + httptools (installed via uvicorn[standard]),
+        # one worker per spare core. Posts live in SQLite so workers share state.
+        workers = int(os.getenv("WORKERS", max(1, (os.cpu_count() or 1) - 1)))
+        uvicorn.run(
+            "main:app",
+            host="0.0.0.0",
+            port=8000,
+            workers=workers,
+            loop="auto",
+            http="auto"
+        )
@@ -0,0 +1,201 @@
+"""
+POST STORE - SQLITE PERSISTENCE
+================================
+Durable post storage backed by SQLite:
+- WAL journal for concurrent readers across server workers
+- Statements defined once and reused (sqlite3 caches them prepared)
+- Index on status for dashboard stats
+- Write transactions with BEGIN IMMEDIATE
+
+Environment Variables (optional):
+- POSTS_DB_PATH (default: backend/posts.db)
+"""
+
+import os
+import json
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Optional, Dict, Any, List
+from pathlib import Path
+
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+# ============== SCHEMA & STATEMENTS ==============
+
+CREATE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS posts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    content TEXT NOT NULL,
+    image_url TEXT,
+    video_url TEXT,
+    platforms TEXT NOT NULL,
+    status TEXT NOT NULL,
+    scheduled_time TEXT,
+    word_count INTEGER,
+    char_count INTEGER,
+    created_at TEXT NOT NULL,
+    posted_time TEXT,
+    tweet_id TEXT,
+    tweet_url TEXT,
+    error_message TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_status ON posts(status);
+"""
+
+INSERT_POST = """
+INSERT INTO posts (
+    content, image_url, video_url, platforms, status, scheduled_time,
+    word_count, char_count, created_at, posted_time, tweet_id, tweet_url, error_message
+) VALUES (
+    :content, :image_url, :video_url, :platforms, :status, :scheduled_time,
+    :word_count, :char_count, :created_at, :posted_time, :tweet_id, :tweet_url, :error_message
+)
+"""
+
+UPDATE_STATUS = """
+UPDATE posts
+SET status = :status, posted_time = :posted_time, tweet_id = :tweet_id,
+    tweet_url = :tweet_url, error_message = :error_message
+WHERE id = :id
+"""
+
+SELECT_BY_ID = "SELECT * FROM posts WHERE id = ?"
+SELECT_ALL = "SELECT * FROM posts ORDER BY id DESC"
+DELETE_BY_ID = "DELETE FROM posts WHERE id = ?"
+SELECT_STATS = "SELECT status, COUNT(*) FROM posts GROUP BY status"
+
+POST_FIELDS = (
+    "content", "image_url", "video_url", "platforms", "status", "scheduled_time",
+    "word_count", "char_count", "created_at", "posted_time", "tweet_id", "tweet_url",
+    "error_message"
+)
+
+
+# ============== POST STORE CLASS ==============
+
+class PostStore:
+    """
+    SQLite-backed post storage.
+
+    Methods are blocking: a write can wait up to BUSY_TIMEOUT seconds for
+    another worker process's lock, so async callers run them via asyncio.to_thread.
+    """
+
+    BUSY_TIMEOUT = 5.0  # seconds
+
+    def __init__(self, db_path: Optional[str] = None):
+        """Open (and create if needed) the posts database."""
+        self.db_path = db_path or os.getenv(
+            "POSTS_DB_PATH",
+            str(Path(__file__).parent / "posts.db")
+        )
+
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(
+            self.db_path,
+            timeout=self.BUSY_TIMEOUT,
+            isolation_level=None,
+            check_same_thread=False
+        )
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(CREATE_SCHEMA)
+
+    @contextmanager
+    def _transaction(self):
+        """Run statements in a write transaction, rolling back on error."""
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield self._conn
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+
+    def _to_dict(self, row: Optional[sqlite3.Row]) -> Optional[Dict[str, Any]]:
+        """Convert a row to the post dict shape used by the API."""
+        if row is None:
+            return None
+
+        post = dict(row)
+        post["platforms"] = json.loads(post["platforms"])
+        return post
+
+    def create_post(self, post: Dict[str, Any]) -> Dict[str, Any]:
+        """Insert a post and return it with its assigned id."""
+        params = {field: post.get(field) for field in POST_FIELDS}
+        params["platforms"] = json.dumps(post.get("platforms", ["twitter"]))
+
+        with self._transaction() as conn:
+            cursor = conn.execute(INSERT_POST, params)
+            row = conn.execute(SELECT_BY_ID, (cursor.lastrowid,)).fetchone()
+
+        return self._to_dict(row)
+
+    def get_post(self, post_id: int) -> Optional[Dict[str, Any]]:
+        """Get a post by id."""
+        with self._lock:
+            row = self._conn.execute(SELECT_BY_ID, (post_id,)).fetchone()
+        return self._to_dict(row)
+
+    def list_posts(self) -> List[Dict[str, Any]]:
+        """List all posts, newest first."""
+        with self._lock:
+            rows = self._conn.execute(SELECT_ALL).fetchall()
+        return [self._to_dict(row) for row in rows]
+
+    def update_status(self, post_id: int, **fields) -> Optional[Dict[str, Any]]:
+        """
+        Update a post's publish status fields.
+
+        Args:
+            post_id: Post to update
+            **fields: status, posted_time, tweet_id, tweet_url, error_message
+
+        Returns:
+            Updated post or None if it does not exist
+        """
+        with self._transaction() as conn:
+            row = conn.execute(SELECT_BY_ID, (post_id,)).fetchone()
+            if row is not None:
+                params = {
+                    key: fields.get(key, row[key])
+                    for key in ("status", "posted_time", "tweet_id", "tweet_url", "error_message")
+                }
+                params["id"] = post_id
+                conn.execute(UPDATE_STATUS, params)
+                row = conn.execute(SELECT_BY_ID, (post_id,)).fetchone()
+
+        return self._to_dict(row)
+
+    def delete_post(self, post_id: int):
+        """Delete a post by id."""
+        with self._transaction() as conn:
+            conn.execute(DELETE_BY_ID, (post_id,))
+
+    def status_counts(self) -> Dict[str, int]:
+        """Count posts per status."""
+        with self._lock:
+            rows = self._conn.execute(SELECT_STATS).fetchall()
+        return {status: count for status, count in rows}
+
+
+# ============== SINGLETON INSTANCE ==============
+
+_post_store: Optional[PostStore] = None
+
+
+def get_post_store() -> PostStore:
+    """Get singleton PostStore instance."""
+    global _post_store
+
+    if _post_store is None:
+        _post_store = PostStore()
+
+    return _post_store
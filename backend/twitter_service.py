@@ -15,12 +15,17 @@ Environment Variables Required:
 - TWITTER_ACCESS_TOKEN_SECRET
 """
 
+import io
 import os
+import time
+import hashlib
+import logging
 import asyncio
 import tempfile
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, List, Tuple, Set
 from pathlib import Path
-from functools import wraps
+from functools import wraps, lru_cache
+from collections import OrderedDict
 
 import httpx
 import tweepy
@@ -28,6 +33,8 @@ from dotenv import load_dotenv
 
 load_dotenv()
 
+log = logging.getLogger("twitter_service")
+
 
 # ============== RETRY DECORATOR ==============
 
@@ -52,14 +59,14 @@ def retry_async(max_retries: int = 3, base_delay: float = 2.0, max_delay: float
                 except tweepy.errors.TooManyRequests as e:
                     # Rate limited - wait longer
                     wait_time = min(base_delay * (3 ** attempt), max_delay)
-                    print(f"[TWITTER] Rate limited. Waiting {wait_time}s before retry {attempt + 1}/{max_retries}")
+                    log.warning("Rate limited. Waiting %ss before retry %s/%s", wait_time, attempt + 1, max_retries)
                     last_error = e
                     await asyncio.sleep(wait_time)
 
                 except tweepy.errors.TwitterServerError as e:
                     # Server error - retry with backoff
                     wait_time = min(base_delay * (2 ** attempt), max_delay)
-                    print(f"[TWITTER] Server error. Retry {attempt + 1}/{max_retries} in {wait_time}s")
+                    log.warning("Server error. Retry %s/%s in %ss", attempt + 1, max_retries, wait_time)
                     last_error = e
                     await asyncio.sleep(wait_time)
 
@@ -67,7 +74,7 @@ def retry_async(max_retries: int = 3, base_delay: float = 2.0, max_delay: float
                     # Other errors - retry with shorter backoff
                     if attempt < max_retries - 1:
                         wait_time = min(base_delay * (2 ** attempt), max_delay)
-                        print(f"[TWITTER] Error: {e}. Retry {attempt + 1}/{max_retries} in {wait_time}s")
+                        log.warning("Error: %s. Retry %s/%s in %ss", e, attempt + 1, max_retries, wait_time)
                         last_error = e
                         await asyncio.sleep(wait_time)
                     else:
@@ -76,13 +83,104 @@ def retry_async(max_retries: int = 3, base_delay: float = 2.0, max_delay: float
 
             # All retries exhausted
             error_msg = str(last_error) if last_error else "Unknown error after retries"
-            print(f"[TWITTER] All {max_retries} retries failed: {error_msg}")
+            log.error("All %s retries failed: %s", max_retries, error_msg)
             raise last_error if last_error else Exception(error_msg)
 
         return wrapper
     return decorator
 
 
+# ============== MEDIA TYPES ==============
+
+CONTENT_TYPE_EXTENSIONS = {
+    'image/jpeg': '.jpg',
+    'image/jpg': '.jpg',
+    'image/png': '.png',
+    'image/gif': '.gif',
+    'image/webp': '.webp',
+    'video/mp4': '.mp4',
+    'video/quicktime': '.mov',
+}
+
+IMAGE_EXTENSIONS = frozenset({'.jpg', '.jpeg', '.png', '.gif', '.webp'})
+VIDEO_EXTENSIONS = frozenset({'.mp4', '.mov'})
+SUPPORTED_EXTENSIONS = IMAGE_EXTENSIONS | VIDEO_EXTENSIONS
+
+# Chunked upload (media_type, media_category) per extension
+CHUNKED_MEDIA_PARAMS = {
+    '.mp4': ('video/mp4', 'tweet_video'),
+    '.mov': ('video/quicktime', 'tweet_video'),
+    '.gif': ('image/gif', 'tweet_gif'),
+    '.jpg': ('image/jpeg', 'tweet_image'),
+    '.jpeg': ('image/jpeg', 'tweet_image'),
+    '.png': ('image/png', 'tweet_image'),
+    '.webp': ('image/webp', 'tweet_image'),
+}
+DEFAULT_CHUNKED_MEDIA_PARAMS = ('video/mp4', 'tweet_video')
+
+
+@lru_cache(maxsize=512)
+def media_type_for_ext(ext: str) -> str:
+    """Classify a lowercase file extension as video, gif, image or unknown."""
+    if ext in VIDEO_EXTENSIONS:
+        return 'video'
+    elif ext == '.gif':
+        return 'gif'
+    elif ext in IMAGE_EXTENSIONS:
+        return 'image'
+    else:
+        return 'unknown'
+
+
+def get_media_type(file_path: str) -> str:
+    """Determine media type from file extension."""
+    return media_type_for_ext(os.path.splitext(file_path)[1].lower())
+
+
+# ============== STREAMING ==============
+
+class StreamUnavailable(Exception):
+    """Remote media cannot be piped to Twitter and must be downloaded first."""
+
+
+# ============== DUPLICATE DETECTION ==============
+
+class BloomFilter:
+    """
+    Fixed-size Bloom filter over 32-byte SHA-256 digests.
+    Bit positions are taken from slices of the digest, so no extra hashing is needed.
+    """
+
+    def __init__(self, num_bits: int = 1 << 20, num_hashes: int = 7):
+        self.num_bits = num_bits
+        self.num_hashes = num_hashes
+        self._bits = bytearray(num_bits // 8)
+
+    def _positions(self, digest: bytes):
+        for i in range(self.num_hashes):
+            yield int.from_bytes(digest[i * 4:i * 4 + 4], 'big') % self.num_bits
+
+    def add(self, digest: bytes):
+        for pos in self._positions(digest):
+            self._bits[pos >> 3] |= 1 << (pos & 7)
+
+    def __contains__(self, digest: bytes) -> bool:
+        return all(self._bits[pos >> 3] & (1 << (pos & 7)) for pos in self._positions(digest))
+
+
+# ============== FILE CLEANUP ==============
+
+def remove_files(file_paths: List[str]):
+    """Remove files, logging rather than raising on failure."""
+    for file_path in file_paths:
+        try:
+            if os.path.exists(file_path):
+                os.remove(file_path)
+                log.info("Cleaned up: %s", file_path)
+        except Exception as e:
+            log.warning("Cleanup warning: %s", e)
+
+
 # ============== TWITTER SERVICE CLASS ==============
 
 class TwitterService:
@@ -96,8 +194,25 @@ class TwitterService:
     MAX_VIDEO_SIZE = 512 * 1024 * 1024    # 512MB
     MAX_GIF_SIZE = 15 * 1024 * 1024       # 15MB
 
-    SUPPORTED_IMAGE_TYPES = ['.jpg', '.jpeg', '.png', '.gif', '.webp']
-    SUPPORTED_VIDEO_TYPES = ['.mp4', '.mov']
+    DOWNLOAD_CHUNK_SIZE = 64 * 1024       # 64KB
+    WRITE_BUFFER_SIZE = 1024 * 1024       # 1MB
+    STATUS_CACHE_TTL = 60.0               # seconds
+
+    # Chunked upload tuning (Twitter caps each APPEND segment at 5MB)
+    SMALL_CHUNK_SIZE = 2 * 1024 * 1024    # 2MB
+    LARGE_CHUNK_SIZE = 4 * 1024 * 1024    # 4MB
+    LARGE_MEDIA_THRESHOLD = 50 * 1024 * 1024  # 50MB
+    UPLOAD_PARALLELISM = 4
+
+    # Uploaded media can be reused until Twitter expires it (24h)
+    MEDIA_CACHE_SIZE = 128
+    MEDIA_CACHE_TTL = 23 * 60 * 60        # seconds
+
+    # Recently posted tweet texts, used to reject duplicates before calling Twitter
+    POSTED_CACHE_SIZE = 1024
+
+    SUPPORTED_IMAGE_TYPES = IMAGE_EXTENSIONS
+    SUPPORTED_VIDEO_TYPES = VIDEO_EXTENSIONS
 
     def __init__(self):
         """Initialize Twitter service with credentials from environment."""
@@ -115,14 +230,30 @@ class TwitterService:
 
         self._client: Optional[tweepy.Client] = None
         self._api: Optional[tweepy.API] = None
-        self._temp_files: List[str] = []
+        self._cleanup_tasks: Set[asyncio.Task] = set()
+        self._status_cache: Optional[Tuple[float, Dict[str, Any]]] = None
+        self._media_id_cache: "OrderedDict[str, Tuple[float, int]]" = OrderedDict()
+        self._posted_filter = BloomFilter()
+        self._posted_cache: "OrderedDict[bytes, str]" = OrderedDict()
+
+        # Shared HTTP client so media downloads reuse connections
+        self._http = httpx.AsyncClient(
+            timeout=60.0,
+            follow_redirects=True,
+            http2=True,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=20)
+        )
 
         if self.enabled:
             self._initialize_clients()
         else:
-            print("[TWITTER] Not configured - missing credentials")
+            log.warning("Not configured - missing credentials")
             self._print_missing_credentials()
 
+    async def aclose(self):
+        """Close the shared HTTP client."""
+        await self._http.aclose()
+
     def _print_missing_credentials(self):
         """Print which credentials are missing."""
         missing = []
@@ -136,7 +267,7 @@ class TwitterService:
             missing.append("TWITTER_ACCESS_TOKEN_SECRET")
 
         if missing:
-            print(f"[TWITTER] Missing: {', '.join(missing)}")
+            log.warning("Missing: %s", ', '.join(missing))
 
     def _initialize_clients(self):
         """Initialize Twitter API clients."""
@@ -159,15 +290,16 @@ class TwitterService:
             )
             self._api = tweepy.API(auth, wait_on_rate_limit=True)
 
-            print("[TWITTER] Clients initialized successfully")
+            log.info("Clients initialized successfully")
 
         except Exception as e:
-            print(f"[TWITTER] Failed to initialize: {e}")
+            log.error("Failed to initialize: %s", e)
             self.enabled = False
 
-    def get_status(self) -> Dict[str, Any]:
+    async def get_status(self) -> Dict[str, Any]:
         """
         Get Twitter connection status with account details.
+        Successful lookups are cached for STATUS_CACHE_TTL seconds.
 
         Returns:
             Dict with connection status, username, user_id, and profile image
@@ -184,9 +316,12 @@ class TwitterService:
                 ]
             }
 
+        if self._status_cache and time.monotonic() - self._status_cache[0] < self.STATUS_CACHE_TTL:
+            return self._status_cache[1]
+
         try:
-            user = self._api.verify_credentials()
-            return {
+            user = await asyncio.to_thread(self._api.verify_credentials)
+            status = {
                 "connected": True,
                 "username": user.screen_name,
                 "user_id": str(user.id),
@@ -195,8 +330,11 @@ class TwitterService:
                 "followers_count": user.followers_count,
                 "following_count": user.friends_count
             }
+            self._status_cache = (time.monotonic(), status)
+            return status
 
         except tweepy.errors.Unauthorized as e:
+            self._status_cache = None
             return {
                 "connected": False,
                 "error": "Invalid credentials - check your API keys"
@@ -208,95 +346,186 @@ class TwitterService:
                 "error": str(e)
             }
 
-    async def download_media(self, url: str) -> Optional[str]:
+    async def download_media(self, url: str, temp_files: List[str]) -> Optional[str]:
         """
         Download media from URL to temporary file.
 
         Args:
             url: URL of the image or video
+            temp_files: Caller-owned list the temp file path is appended to for cleanup
 
         Returns:
             Local file path or None if download failed
         """
         try:
-            print(f"[TWITTER] Downloading media from: {url[:80]}...")
+            log.info("Downloading media from: %s...", url[:80])
 
-            async with httpx.AsyncClient(timeout=60.0, follow_redirects=True) as client:
-                response = await client.get(url)
+            async with self._http.stream("GET", url) as response:
                 response.raise_for_status()
 
                 # Determine file extension from content type
-                content_type = response.headers.get('content-type', '')
-
-                ext_map = {
-                    'image/jpeg': '.jpg',
-                    'image/jpg': '.jpg',
-                    'image/png': '.png',
-                    'image/gif': '.gif',
-                    'image/webp': '.webp',
-                    'video/mp4': '.mp4',
-                    'video/quicktime': '.mov',
-                }
-
-                ext = None
-                for ct, extension in ext_map.items():
-                    if ct in content_type:
-                        ext = extension
-                        break
-
-                if not ext:
-                    # Try to get from URL
-                    url_path = url.split('?')[0]
-                    ext = Path(url_path).suffix.lower()
-                    if ext not in self.SUPPORTED_IMAGE_TYPES + self.SUPPORTED_VIDEO_TYPES:
-                        ext = '.jpg'  # Default
+                ext = self._ext_from_response(url, response.headers.get('content-type', ''))
 
-                # Create temp file
+                # Create temp file and stream the body into it
                 temp_file = tempfile.NamedTemporaryFile(
                     delete=False,
                     suffix=ext,
-                    prefix='twitter_'
+                    prefix='twitter_',
+                    buffering=self.WRITE_BUFFER_SIZE
                 )
-                temp_file.write(response.content)
-                temp_file.close()
+                temp_files.append(temp_file.name)
 
-                self._temp_files.append(temp_file.name)
+                file_size = 0
+                with temp_file:
+                    async for chunk in response.aiter_bytes(self.DOWNLOAD_CHUNK_SIZE):
+                        file_size += len(chunk)
+                        if file_size > self.MAX_VIDEO_SIZE:
+                            raise ValueError(
+                                f"Media exceeds {self.MAX_VIDEO_SIZE:,} bytes"
+                            )
+                        temp_file.write(chunk)
 
-                file_size = len(response.content)
-                print(f"[TWITTER] Downloaded: {temp_file.name} ({file_size:,} bytes)")
+                log.info("Downloaded: %s (%s bytes)", temp_file.name, file_size)
 
                 return temp_file.name
 
         except Exception as e:
-            print(f"[TWITTER] Download failed: {e}")
+            log.error("Download failed: %s", e)
             return None
 
-    def _get_media_type(self, file_path: str) -> str:
-        """Determine media type from file extension."""
-        ext = Path(file_path).suffix.lower()
+    def _ext_from_response(self, url: str, content_type: str) -> str:
+        """Determine a file extension from a response content type or URL."""
+        mime = content_type.split(';', 1)[0].strip().lower()
+        ext = CONTENT_TYPE_EXTENSIONS.get(mime)
+        if ext:
+            return ext
+
+        # Try to get from URL
+        url_path = url.split('?')[0]
+        ext = Path(url_path).suffix.lower()
+        if ext not in SUPPORTED_EXTENSIONS:
+            ext = '.jpg'  # Default
+        return ext
+
+    async def stream_url_to_twitter(self, url: str) -> Optional[int]:
+        """
+        Pipe remote media straight into a Twitter chunked upload.
+        Bytes are buffered only up to one APPEND segment, never written to disk.
 
-        if ext in self.SUPPORTED_VIDEO_TYPES:
-            return 'video'
-        elif ext == '.gif':
-            return 'gif'
-        elif ext in self.SUPPORTED_IMAGE_TYPES:
-            return 'image'
-        else:
-            return 'unknown'
+        Args:
+            url: URL of the image or video
+
+        Returns:
+            Twitter media ID or None if the upload failed
+
+        Raises:
+            StreamUnavailable: the server sent no Content-Length (which INIT requires)
+                or a compressed body whose decoded size is unknown
+        """
+        try:
+            log.info("Streaming media from: %s...", url[:80])
+
+            async with self._http.stream("GET", url) as response:
+                response.raise_for_status()
+
+                # Content-Length is the encoded size but aiter_bytes() yields decoded bytes
+                encoding = response.headers.get('content-encoding', 'identity').strip().lower()
+                if encoding != 'identity':
+                    raise StreamUnavailable(f"Content-Encoding {encoding} - cannot stream upload")
+
+                total_bytes = int(response.headers.get('content-length', 0))
+                if not total_bytes:
+                    raise StreamUnavailable("No Content-Length - cannot stream upload")
+                if total_bytes > self.MAX_VIDEO_SIZE:
+                    raise ValueError(f"Media exceeds {self.MAX_VIDEO_SIZE:,} bytes")
+
+                ext = self._ext_from_response(url, response.headers.get('content-type', ''))
+                media_type, media_category = CHUNKED_MEDIA_PARAMS.get(ext, DEFAULT_CHUNKED_MEDIA_PARAMS)
+
+                media = await asyncio.to_thread(
+                    self._api.chunked_upload_init,
+                    total_bytes,
+                    media_type,
+                    media_category=media_category
+                )
+                media_id = media.media_id
+
+                chunk_size = self._chunk_size_for(total_bytes)
+                semaphore = asyncio.Semaphore(self.UPLOAD_PARALLELISM)
+                appends: List[asyncio.Task] = []
+                errors: List[BaseException] = []
+                received = 0
+                buf = bytearray()
+
+                async def append(chunk: bytes, segment_index: int):
+                    try:
+                        await asyncio.to_thread(
+                            self._api.chunked_upload_append,
+                            media_id,
+                            io.BytesIO(chunk),
+                            segment_index
+                        )
+                    except Exception as e:
+                        errors.append(e)
+                        raise
+                    finally:
+                        semaphore.release()
+
+                async def flush(chunk: bytes):
+                    # Stop reading as soon as any segment has failed
+                    if errors:
+                        raise errors[0]
+                    await semaphore.acquire()
+                    if errors:
+                        semaphore.release()
+                        raise errors[0]
+                    appends.append(asyncio.create_task(append(chunk, len(appends))))
+
+                try:
+                    async for data in response.aiter_bytes(self.DOWNLOAD_CHUNK_SIZE):
+                        received += len(data)
+                        if received > total_bytes:
+                            raise ValueError("Media larger than its Content-Length")
+                        buf += data
+                        while len(buf) >= chunk_size:
+                            await flush(bytes(buf[:chunk_size]))
+                            del buf[:chunk_size]
+
+                    if buf:
+                        await flush(bytes(buf))
+
+                    await asyncio.gather(*appends)
+
+                except BaseException:
+                    for task in appends:
+                        task.cancel()
+                    await asyncio.gather(*appends, return_exceptions=True)
+                    raise
+
+            log.info("Streamed %s bytes in %s segment(s)", received, len(appends))
 
-    def _upload_image(self, file_path: str) -> Optional[int]:
+            return await self._finalize_upload(media_id)
+
+        except StreamUnavailable:
+            raise
+
+        except Exception as e:
+            log.error("Streaming upload failed: %s", e)
+            return None
+
+    async def _upload_image(self, file_path: str) -> Optional[int]:
         """Upload image to Twitter."""
         try:
-            print(f"[TWITTER] Uploading image: {file_path}")
-            media = self._api.media_upload(filename=file_path)
-            print(f"[TWITTER] Image uploaded. Media ID: {media.media_id}")
+            log.info("Uploading image: %s", file_path)
+            media = await asyncio.to_thread(self._api.media_upload, filename=file_path)
+            log.info("Image uploaded. Media ID: %s", media.media_id)
             return media.media_id
 
         except Exception as e:
-            print(f"[TWITTER] Image upload error: {e}")
+            log.error("Image upload error: %s", e)
             return None
 
-    def _upload_video_chunked(self, file_path: str) -> Optional[int]:
+    async def _upload_video_chunked(self, file_path: str) -> Optional[int]:
         """
         Upload video using chunked upload API.
         Required for videos > 5MB and all GIFs.
@@ -306,49 +535,159 @@ class TwitterService:
             ext = Path(file_path).suffix.lower()
 
             # Determine media type and category
-            if ext == '.mp4':
-                media_type = 'video/mp4'
-                media_category = 'tweet_video'
-            elif ext == '.mov':
-                media_type = 'video/quicktime'
-                media_category = 'tweet_video'
-            elif ext == '.gif':
-                media_type = 'image/gif'
-                media_category = 'tweet_gif'
-            else:
-                media_type = 'video/mp4'
-                media_category = 'tweet_video'
-
-            print(f"[TWITTER] Chunked upload: {file_path} ({file_size:,} bytes)")
-            print(f"[TWITTER] Media type: {media_type}, Category: {media_category}")
-
-            # Chunked upload with progress
-            media = self._api.chunked_upload(
-                filename=file_path,
-                media_type=media_type,
-                media_category=media_category,
-                wait_for_async_finalize=True
+            media_type, media_category = CHUNKED_MEDIA_PARAMS.get(ext, DEFAULT_CHUNKED_MEDIA_PARAMS)
+
+            log.info("Chunked upload: %s (%s bytes)", file_path, file_size)
+            log.info("Media type: %s, Category: %s", media_type, media_category)
+
+            media_id = await self._chunked_upload_parallel(
+                file_path, file_size, media_type, media_category
             )
 
-            print(f"[TWITTER] Video uploaded. Media ID: {media.media_id}")
-            return media.media_id
+            log.info("Video uploaded. Media ID: %s", media_id)
+            return media_id
 
         except Exception as e:
-            print(f"[TWITTER] Video upload error: {e}")
+            log.error("Video upload error: %s", e)
+            return None
+
+    def _chunk_size_for(self, file_size: int) -> int:
+        """Pick an APPEND segment size: small files favour more parallel segments."""
+        if file_size < self.LARGE_MEDIA_THRESHOLD:
+            return self.SMALL_CHUNK_SIZE
+        return self.LARGE_CHUNK_SIZE
+
+    def _append_segment(self, media_id: int, file_path: str, segment_index: int, chunk_size: int):
+        """Read one segment of a file and APPEND it to a chunked upload."""
+        with open(file_path, 'rb') as f:
+            f.seek(segment_index * chunk_size)
+            chunk = f.read(chunk_size)
+
+        self._api.chunked_upload_append(media_id, io.BytesIO(chunk), segment_index)
+
+    async def _chunked_upload_parallel(
+        self,
+        file_path: str,
+        file_size: int,
+        media_type: str,
+        media_category: str
+    ) -> int:
+        """
+        INIT, APPEND segments concurrently, then FINALIZE a chunked upload.
+        The first failed segment cancels the ones still waiting to upload.
+
+        Returns:
+            Twitter media ID once processing has completed
+        """
+        if file_size == 0:
+            raise ValueError("Cannot upload an empty media file")
+
+        media = await asyncio.to_thread(
+            self._api.chunked_upload_init,
+            file_size,
+            media_type,
+            media_category=media_category
+        )
+        media_id = media.media_id
+
+        chunk_size = self._chunk_size_for(file_size)
+        segments = -(-file_size // chunk_size)
+        semaphore = asyncio.Semaphore(self.UPLOAD_PARALLELISM)
+
+        log.info("Uploading %s segment(s) of %s bytes", segments, chunk_size)
+
+        async def append(segment_index: int):
+            async with semaphore:
+                await asyncio.to_thread(
+                    self._append_segment, media_id, file_path, segment_index, chunk_size
+                )
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                for i in range(segments):
+                    group.create_task(append(i))
+        except ExceptionGroup as eg:
+            # Surface the first failed APPEND's error rather than the group wrapper
+            raise eg.exceptions[0] from eg
+
+        return await self._finalize_upload(media_id)
+
+    async def _finalize_upload(self, media_id: int) -> int:
+        """FINALIZE a chunked upload and wait for async processing to finish."""
+        media = await asyncio.to_thread(self._api.chunked_upload_finalize, media_id)
+
+        processing_info = getattr(media, 'processing_info', None)
+        while processing_info and processing_info.get('state') in ('pending', 'in_progress'):
+            await asyncio.sleep(processing_info.get('check_after_secs', 1))
+            media = await asyncio.to_thread(self._api.get_media_upload_status, media_id)
+            processing_info = getattr(media, 'processing_info', None)
+
+        if processing_info and processing_info.get('state') == 'failed':
+            error = processing_info.get('error', {}).get('message', 'processing failed')
+            raise Exception(f"Media processing failed: {error}")
+
+        return media_id
+
+    def _file_sha256(self, file_path: str) -> str:
+        """Hash a file's contents."""
+        with open(file_path, 'rb') as f:
+            return hashlib.file_digest(f, 'sha256').hexdigest()
+
+    def _cached_media_id(self, digest: str) -> Optional[int]:
+        """Look up a still-valid media ID for previously uploaded content."""
+        entry = self._media_id_cache.get(digest)
+        if not entry:
+            return None
+
+        uploaded_at, media_id = entry
+        if time.monotonic() - uploaded_at > self.MEDIA_CACHE_TTL:
+            del self._media_id_cache[digest]
+            return None
+
+        self._media_id_cache.move_to_end(digest)
+        return media_id
+
+    def _cache_media_id(self, digest: str, media_id: int):
+        """Remember a media ID, evicting the least recently used entry."""
+        self._media_id_cache[digest] = (time.monotonic(), media_id)
+        self._media_id_cache.move_to_end(digest)
+        if len(self._media_id_cache) > self.MEDIA_CACHE_SIZE:
+            self._media_id_cache.popitem(last=False)
+
+    def _find_duplicate(self, digest: bytes) -> Optional[str]:
+        """
+        Return the tweet ID if this content digest was posted recently.
+        The Bloom filter rules out new content cheaply; the LRU confirms hits.
+        """
+        if digest not in self._posted_filter:
             return None
 
-    async def upload_media(self, media_source: str) -> Optional[int]:
+        tweet_id = self._posted_cache.get(digest)
+        if tweet_id:
+            self._posted_cache.move_to_end(digest)
+        return tweet_id
+
+    def _remember_posted(self, digest: bytes, tweet_id: str):
+        """Record posted content for duplicate detection."""
+        self._posted_filter.add(digest)
+        self._posted_cache[digest] = tweet_id
+        self._posted_cache.move_to_end(digest)
+        if len(self._posted_cache) > self.POSTED_CACHE_SIZE:
+            self._posted_cache.popitem(last=False)
+
+    async def upload_media(self, media_source: str, temp_files: List[str]) -> Optional[int]:
         """
         Upload media to Twitter from URL or local path.
 
         Args:
             media_source: URL (http/https) or local file path
+            temp_files: Caller-owned list collecting any temp files to clean up
 
         Returns:
             Twitter media ID or None if upload failed
         """
         if not self.enabled:
-            print("[TWITTER] Cannot upload - not configured")
+            log.warning("Cannot upload - not configured")
             return None
 
         file_path = media_source
@@ -356,33 +695,50 @@ class TwitterService:
         # Handle file:// prefix
         if media_source.startswith('file://'):
             file_path = media_source[7:]
-            print(f"[TWITTER] Using local file: {file_path}")
+            log.info("Using local file: %s", file_path)
 
-        # Download if URL
+        # Stream URL straight to Twitter, downloading only as a fallback
         elif media_source.startswith('http://') or media_source.startswith('https://'):
-            file_path = await self.download_media(media_source)
+            try:
+                return await self.stream_url_to_twitter(media_source)
+            except StreamUnavailable as e:
+                log.warning("%s - downloading instead", e)
+
+            file_path = await self.download_media(media_source, temp_files)
             if not file_path:
-                print("[TWITTER] Media download failed")
+                log.warning("Media download failed")
                 return None
 
         # Verify file exists
         if not os.path.exists(file_path):
-            print(f"[TWITTER] File not found: {file_path}")
+            log.warning("File not found: %s", file_path)
             return None
 
+        # Reuse the media ID if this exact content was uploaded recently
+        digest = await asyncio.to_thread(self._file_sha256, file_path)
+        media_id = self._cached_media_id(digest)
+        if media_id:
+            log.info("Reusing uploaded media: %s", media_id)
+            return media_id
+
         # Determine type and upload
-        media_type = self._get_media_type(file_path)
+        media_type = get_media_type(file_path)
 
         if media_type == 'video':
-            return self._upload_video_chunked(file_path)
+            media_id = await self._upload_video_chunked(file_path)
         elif media_type == 'gif':
-            return self._upload_video_chunked(file_path)
+            media_id = await self._upload_video_chunked(file_path)
         elif media_type == 'image':
-            return self._upload_image(file_path)
+            media_id = await self._upload_image(file_path)
         else:
-            print(f"[TWITTER] Unsupported media type: {media_type}")
+            log.warning("Unsupported media type: %s", media_type)
             return None
 
+        if media_id:
+            self._cache_media_id(digest, media_id)
+
+        return media_id
+
     @retry_async(max_retries=3, base_delay=2.0)
     async def post(
         self,
@@ -411,49 +767,59 @@ class TwitterService:
                 "platform": "twitter"
             }
 
+        # Temp files are tracked per call so concurrent posts never touch each other's files
+        temp_files: List[str] = []
+
         try:
             # Truncate content if needed
             original_length = len(content)
             if original_length > self.MAX_TWEET_LENGTH:
                 content = content[:self.MAX_TWEET_LENGTH - 3] + "..."
-                print(f"[TWITTER] Content truncated: {original_length} -> {len(content)} chars")
+                log.warning("Content truncated: %s -> %s chars", original_length, len(content))
+
+            # Reject content we already posted without a Twitter round-trip
+            content_digest = hashlib.sha256(content.encode()).digest()
+            duplicate_of = self._find_duplicate(content_digest)
+            if duplicate_of:
+                log.warning("Duplicate of tweet %s - skipping", duplicate_of)
+                return {
+                    "success": False,
+                    "error": "Duplicate content - this tweet was already posted",
+                    "duplicate_of": duplicate_of,
+                    "platform": "twitter"
+                }
+
+            # Text-only fast path: no media plumbing at all
+            if not media_url and not media_path:
+                log.info("Posting tweet (%s chars)...", len(content))
+                response = await asyncio.to_thread(self._client.create_tweet, text=content)
+                return self._format_success(response, content, content_digest, has_media=False)
 
             # Handle media upload
             media_ids = None
             media_source = media_url or media_path
 
-            if media_source:
-                print(f"[TWITTER] Processing media...")
-                media_id = await self.upload_media(media_source)
+            log.info("Processing media...")
+            media_id = await self.upload_media(media_source, temp_files)
 
-                if media_id:
-                    media_ids = [media_id]
-                    print(f"[TWITTER] Media ready: {media_id}")
-                else:
-                    print("[TWITTER] Media upload failed - posting text only")
+            if media_id:
+                media_ids = [media_id]
+                log.info("Media ready: %s", media_id)
+            else:
+                log.warning("Media upload failed - posting text only")
 
             # Create tweet
-            print(f"[TWITTER] Posting tweet ({len(content)} chars)...")
+            log.info("Posting tweet (%s chars)...", len(content))
 
-            response = self._client.create_tweet(
+            response = await asyncio.to_thread(
+                self._client.create_tweet,
                 text=content,
                 media_ids=media_ids
             )
 
-            tweet_id = str(response.data["id"])
-            tweet_url = f"https://twitter.com/i/web/status/{tweet_id}"
-
-            print(f"[TWITTER] SUCCESS! Tweet ID: {tweet_id}")
-            print(f"[TWITTER] URL: {tweet_url}")
-
-            return {
-                "success": True,
-                "post_id": tweet_id,
-                "url": tweet_url,
-                "platform": "twitter",
-                "char_count": len(content),
-                "has_media": media_ids is not None
-            }
+            return self._format_success(
+                response, content, content_digest, has_media=media_ids is not None
+            )
 
         except tweepy.errors.Forbidden as e:
             error_msg = str(e)
@@ -463,7 +829,7 @@ class TwitterService:
             elif "403" in error_msg:
                 error_msg = "Access forbidden - check your app permissions"
 
-            print(f"[TWITTER] Forbidden: {error_msg}")
+            log.error("Forbidden: %s", error_msg)
             return {
                 "success": False,
                 "error": error_msg,
@@ -471,7 +837,7 @@ class TwitterService:
             }
 
         except tweepy.errors.Unauthorized as e:
-            print(f"[TWITTER] Unauthorized: {e}")
+            log.error("Unauthorized: %s", e)
             return {
                 "success": False,
                 "error": "Authentication failed - check your API credentials",
@@ -479,11 +845,11 @@ class TwitterService:
             }
 
         except tweepy.errors.TweepyException as e:
-            print(f"[TWITTER] Tweepy error: {e}")
+            log.error("Tweepy error: %s", e)
             raise  # Let retry decorator handle it
 
         except Exception as e:
-            print(f"[TWITTER] Unexpected error: {e}")
+            log.error("Unexpected error: %s", e)
             return {
                 "success": False,
                 "error": str(e),
@@ -492,19 +858,41 @@ class TwitterService:
 
         finally:
             # Cleanup temporary files
-            self._cleanup_temp_files()
+            self._cleanup_temp_files(temp_files)
 
-    def _cleanup_temp_files(self):
-        """Remove temporary downloaded files."""
-        for file_path in self._temp_files:
-            try:
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-                    print(f"[TWITTER] Cleaned up: {file_path}")
-            except Exception as e:
-                print(f"[TWITTER] Cleanup warning: {e}")
-
-        self._temp_files = []
+    def _format_success(
+        self,
+        response: Any,
+        content: str,
+        content_digest: bytes,
+        has_media: bool
+    ) -> Dict[str, Any]:
+        """Record a successful tweet and build the success result."""
+        tweet_id = str(response.data["id"])
+        tweet_url = f"https://twitter.com/i/web/status/{tweet_id}"
+        self._remember_posted(content_digest, tweet_id)
+
+        log.info("SUCCESS! Tweet ID: %s", tweet_id)
+        log.info("URL: %s", tweet_url)
+
+        return {
+            "success": True,
+            "post_id": tweet_id,
+            "url": tweet_url,
+            "platform": "twitter",
+            "char_count": len(content),
+            "has_media": has_media
+        }
+
+    def _cleanup_temp_files(self, temp_files: List[str]):
+        """Remove temporary downloaded files in the background."""
+        if not temp_files:
+            return
+
+        # Keep a reference so the task is not garbage collected mid-run
+        task = asyncio.create_task(asyncio.to_thread(remove_files, temp_files))
+        self._cleanup_tasks.add(task)
+        task.add_done_callback(self._cleanup_tasks.discard)
 
 
 # ============== SINGLETON INSTANCE ==============
@@ -522,11 +910,22 @@ def get_twitter_service() -> TwitterService:
     return _twitter_service
 
 
+async def close_twitter_service():
+    """Close and drop the singleton so a later startup builds a fresh one."""
+    global _twitter_service
+
+    if _twitter_service is not None:
+        service, _twitter_service = _twitter_service, None
+        await service.aclose()
+
+
 # ============== TESTING ==============
 
 if __name__ == "__main__":
     import asyncio
 
+    logging.basicConfig(level=logging.INFO, format="[TWITTER] %(message)s")
+
     async def test():
         print("\n" + "=" * 50)
         print("TWITTER SERVICE TEST")
@@ -535,7 +934,7 @@ if __name__ == "__main__":
         service = get_twitter_service()
 
         print("\n1. Checking status...")
-        status = service.get_status()
+        status = await service.get_status()
         print(f"   Connected: {status.get('connected')}")
 
         if status.get('connected'):